@@ -11,7 +11,12 @@ class JupiterPluginOptions:
 
 class JupiterPlugin(PluginBase):
     def __init__(self, options: JupiterPluginOptions):
-        super().__init__("jupiter", [JupiterService()])
+        self.service = JupiterService()
+        super().__init__("jupiter", [self.service])
+
+    async def close(self):
+        """Close the service's shared HTTP session."""
+        await self.service.close()
 
     def supports_chain(self, chain) -> bool:
         return chain['type'] == 'solana'
@@ -1,5 +1,12 @@
+import asyncio
 import base64
+import json
+import logging
+import re
 import aiohttp
+import orjson
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
 from goat.decorators.tool import Tool
 from goat_wallets.solana.wallet import SolanaTransaction
 from solders.message import MessageV0
@@ -8,10 +15,151 @@ from .parameters import GetQuoteParameters, QuoteResponse
 from goat_wallets.solana import SolanaWalletClient
 
 
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps(obj) -> str:
+    try:
+        return orjson.dumps(obj).decode()
+    except TypeError:
+        # orjson rejects integers wider than 64 bits; fall back to the stdlib encoder
+        return json.dumps(obj)
+
+
+# Runs of 20+ digits may be integers wider than 64 bits, which orjson parses as floats
+_WIDE_INT_RE = re.compile(rb"\d{20}")
+
+
+def _json_loads(body: bytes) -> Any:
+    if _WIDE_INT_RE.search(body):
+        # Keep wide integers exact with the stdlib decoder, mirroring _json_dumps
+        return json.loads(body)
+    return orjson.loads(body)
+
+
+QuoteCacheKey = Tuple[str, str, int, str, Optional[int]]
+
+
 class JupiterService:
-    def __init__(self):
+    def __init__(self, ttl_seconds: float = 10):
+        """Initialize the Jupiter service.
+
+        Args:
+            ttl_seconds: How long a quote is reused for identical requests. Jupiter quotes are
+                only valid for a short window, so keep this small; 0 disables caching.
+        """
         self.base_url = "https://quote-api.jup.ag/v6"
+        self._quote_url = f"{self.base_url}/quote"
+        self._swap_url = f"{self.base_url}/swap"
         self._timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.ttl_seconds = ttl_seconds
+        # Raw quote bodies; each hit parses a fresh dict so callers can never mutate the cache
+        self._quote_cache: Dict[QuoteCacheKey, Tuple[float, bytes]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        Quote and swap calls hit the same host, so keeping one pooled session
+        avoids a new TCP+TLS handshake per request. A session only works on the event loop
+        that created it, and PluginBase may run each tool call on a fresh loop, so a new
+        session is created whenever the running loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                json_serialize=_json_dumps,
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75, ttl_dns_cache=300),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session.
+
+        A session left on another (possibly already closed) loop cannot be awaited from here,
+        so it is only dropped.
+        """
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_loop is asyncio.get_running_loop()
+        ):
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @staticmethod
+    def _quote_cache_key(params: GetQuoteParameters) -> QuoteCacheKey:
+        return (params.inputMint, params.outputMint, params.amount, params.swapMode.value, params.slippageBps)
+
+    def _get_cached_quote(self, key: QuoteCacheKey) -> Optional[bytes]:
+        entry = self._quote_cache.get(key)
+        if entry is None:
+            return None
+        fetched_at, quote = entry
+        if monotonic() - fetched_at > self.ttl_seconds:
+            del self._quote_cache[key]
+            return None
+        return quote
+
+    def _store_quote(self, key: QuoteCacheKey, quote: bytes):
+        if self.ttl_seconds <= 0:
+            return
+        now = monotonic()
+        # Drop expired entries so the cache stays bounded by the request rate within one TTL window
+        expired = [k for k, (fetched_at, _) in self._quote_cache.items() if now - fetched_at > self.ttl_seconds]
+        for k in expired:
+            del self._quote_cache[k]
+        self._quote_cache[key] = (now, quote)
+
+    async def _fetch_quote_raw(self, params: GetQuoteParameters) -> dict:
+        """Fetch a validated quote as the raw JSON dict returned by the API, using the quote cache."""
+        cache_key = self._quote_cache_key(params)
+        cached_quote = self._get_cached_quote(cache_key)
+        if cached_quote is not None:
+            return _json_loads(cached_quote)
+
+        # Convert parameters to dict and ensure required fields are properly formatted
+        request_params = {
+            'inputMint': params.inputMint,
+            'outputMint': params.outputMint,
+            'amount': str(params.amount),
+            'swapMode': params.swapMode.value,
+            'slippageBps': str(params.slippageBps) if params.slippageBps is not None else None
+        }
+        # Drop optional parameters that are not set
+        request_params = {k: v for k, v in request_params.items() if v is not None}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Requesting quote with parameters: %s", request_params)
+        session = await self._get_session()
+        async with session.get(self._quote_url, params=request_params) as response:
+            if response.status != 200:
+                body = await response.read()
+                try:
+                    error = _json_loads(body).get('error', 'Unknown error')
+                except (ValueError, AttributeError):
+                    error = body.decode(errors="replace")
+                raise Exception(f"Failed to get quote: {error}")
+            
+            # Parse the body bytes directly, skipping the str decode
+            body = await response.read()
+            response_data = _json_loads(body)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Got quote response: %s", response_data)
+            # Only a well-formed quote may be cached and forwarded to the swap endpoint
+            QuoteResponse.model_validate(response_data)
+            self._store_quote(cache_key, body)
+
+            return response_data
 
     @Tool({
         "description": "Get a quote for a swap on the Jupiter DEX",
@@ -21,33 +169,7 @@ class JupiterService:
         """Get a quote for swapping tokens using Jupiter."""
         try:
             params = GetQuoteParameters.model_validate(parameters)
-            # Convert parameters to dict and ensure required fields are properly formatted
-            request_params = {
-                'inputMint': params.inputMint,
-                'outputMint': params.outputMint,
-                'amount': str(params.amount),
-                'swapMode': params.swapMode.value
-            }
-            # Add optional parameters if they are set
-            if params.slippageBps is not None:
-                request_params['slippageBps'] = str(params.slippageBps)
-            print(f"Requesting quote with parameters: {request_params}")
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.get(f"{self.base_url}/quote", params=request_params) as response:
-                    response_text = await response.text()
-                    print(f"Got response: {response_text}")
-                    
-                    if response.status != 200:
-                        try:
-                            error_data = await response.json()
-                            raise Exception(f"Failed to get quote: {error_data.get('error', 'Unknown error')}")
-                        except:
-                            raise Exception(f"Failed to get quote: {response_text}")
-                    
-                    response_data = await response.json()
-                    QuoteResponse.model_validate(response_data)
-
-                    return response_data
+            return await self._fetch_quote_raw(params)
         except aiohttp.ClientResponseError as error:
             error_message = f"Failed to get quote: {str(error)}"
             if error.status != 404:  # Only try to parse response for non-404 errors
@@ -66,58 +188,14 @@ class JupiterService:
     async def swap_tokens(self, wallet_client: SolanaWalletClient, parameters: dict):
         """Swap tokens using Jupiter DEX."""
         try:
-            # First get the quote
-            quote_response = await self.get_quote(parameters)
-            
-            # Transform quote response following the same structure as in TypeScript
-            transformed_quote_response = {
-                "inputMint": quote_response.get("inputMint"),
-                "inAmount": quote_response.get("inAmount"),
-                "outputMint": quote_response.get("outputMint"),
-                "outAmount": quote_response.get("outAmount"),
-                "otherAmountThreshold": quote_response.get("otherAmountThreshold"),
-                "swapMode": quote_response.get("swapMode"),
-                "slippageBps": quote_response.get("slippageBps"),
-                "priceImpactPct": quote_response.get("priceImpactPct"),
-                "routePlan": [
-                    {
-                        "swapInfo": {
-                            "ammKey": step.get("swapInfo", {}).get("ammKey"),
-                            "label": step.get("swapInfo", {}).get("label"),
-                            "inputMint": step.get("swapInfo", {}).get("inputMint"),
-                            "outputMint": step.get("swapInfo", {}).get("outputMint"),
-                            "inAmount": step.get("swapInfo", {}).get("inAmount"),
-                            "outAmount": step.get("swapInfo", {}).get("outAmount"),
-                            "feeAmount": step.get("swapInfo", {}).get("feeAmount"),
-                            "feeMint": step.get("swapInfo", {}).get("feeMint")
-                        },
-                        "percent": step.get("percent")
-                    }
-                    for step in quote_response.get("routePlan", [])
-                ]
-            }
-
-            # Remove None values from the transformed response
-            transformed_quote_response = {k: v for k, v in transformed_quote_response.items() if v is not None}
-
-            # Add optional fields if they exist
-            for field in ["computedAutoSlippage", "contextSlot", "timeTaken"]:
-                if field in quote_response and quote_response[field] is not None:
-                    transformed_quote_response[field] = quote_response[field]
-
-            if "platformFee" in quote_response and quote_response["platformFee"]:
-                platform_fee = quote_response["platformFee"]
-                fee_data = {}
-                if "amount" in platform_fee:
-                    fee_data["amount"] = platform_fee["amount"]
-                if "feeBps" in platform_fee:
-                    fee_data["feeBps"] = platform_fee["feeBps"]
-                if fee_data:
-                    transformed_quote_response["platformFee"] = fee_data
+            # First get the quote, already validated by _fetch_quote_raw. The swap endpoint takes
+            # the quote exactly as the quote endpoint returned it, so pass the raw JSON through
+            # rather than a re-serialized QuoteResponse model
+            quote_response = await self._fetch_quote_raw(GetQuoteParameters.model_validate(parameters))
 
             # Prepare the full swap request
             swap_request = {
-                "quoteResponse": transformed_quote_response,
+                "quoteResponse": quote_response,
                 "userPublicKey": wallet_client.get_address(),
                 "dynamicComputeUnitLimit": True,
                 "prioritizationFeeLamports": "auto",
@@ -131,24 +209,29 @@ class JupiterService:
             }
             
             # Get swap transaction
-            async with aiohttp.ClientSession(timeout=self._timeout) as session:
-                async with session.post(f"{self.base_url}/swap", json=swap_request) as response:
-                    if response.status != 200:
-                        error_data = await response.json()
-                        raise Exception(f"Failed to create swap transaction: {error_data.get('error', 'Unknown error')}")
-                    
-                    swap_response = await response.json()
-                    swap_transaction = swap_response.get("swapTransaction")
-                    
-                    if not swap_transaction:
-                        raise Exception("No swap transaction returned")
-                    
-                    # Send the raw transaction directly
-                    result = wallet_client.send_raw_transaction(swap_transaction)
-                    
-                    return {
-                        "hash": result["hash"]
-                    }
-                    
+            session = await self._get_session()
+            async with session.post(self._swap_url, json=swap_request) as response:
+                if response.status != 200:
+                    error_data = _json_loads(await response.read())
+                    raise Exception(f"Failed to create swap transaction: {error_data.get('error', 'Unknown error')}")
+                
+                swap_response = _json_loads(await response.read())
+                swap_transaction = swap_response.get("swapTransaction")
+                
+                if not swap_transaction:
+                    raise Exception("No swap transaction returned")
+                
+                # Send the raw transaction directly
+                result = wallet_client.send_raw_transaction(swap_transaction)
+                
+                return {
+                    "hash": result["hash"]
+                }
+                
         except Exception as error:
+            # The cached quote may be stale (e.g. the route moved), so force a fresh one on retry
+            try:
+                self._quote_cache.pop(self._quote_cache_key(GetQuoteParameters.model_validate(parameters)), None)
+            except Exception:
+                pass
             raise Exception(f"Failed to swap tokens: {error}")
@@ -13,7 +13,12 @@ class UniswapPluginOptions:
 class UniswapPlugin(PluginBase):
     """Uniswap plugin for token swaps on supported EVM chains."""
     def __init__(self, options: UniswapPluginOptions):
-        super().__init__("uniswap", [UniswapService(options.api_key, options.base_url)])
+        self.service = UniswapService(options.api_key, options.base_url)
+        super().__init__("uniswap", [self.service])
+
+    async def close(self):
+        """Close the service's shared HTTP session."""
+        await self.service.close()
 
     def supports_chain(self, chain) -> bool:
         """Check if the chain is supported by Uniswap.
@@ -1,14 +1,47 @@
+import asyncio
+import logging
+import re
 import aiohttp
 import json
-from typing import Any, Dict, cast
+import orjson
+from typing import Any, Dict, Optional, Tuple, cast
 from eth_typing import HexStr
 from goat.decorators.tool import Tool
 from .parameters import CheckApprovalParameters, GetQuoteParameters
 from goat_wallets.evm import EVMTransaction, EVMTypedData
-from goat_wallets.evm import EVMWalletClient
+from goat_wallets.evm import EVMWalletClient, EVMSmartWalletClient
 from goat_plugins.erc20.abi import ERC20_ABI
 
 
+logger = logging.getLogger(__name__)
+
+# Messages for known Uniswap API error codes
+_UNISWAP_ERRORS = {
+    "VALIDATION_ERROR": "Invalid parameters provided to the API",
+    "INSUFFICIENT_BALANCE": "Insufficient balance for the requested operation",
+    "RATE_LIMIT": "API rate limit exceeded",
+}
+
+
+def _json_dumps(obj) -> str:
+    try:
+        return orjson.dumps(obj).decode()
+    except TypeError:
+        # orjson rejects integers wider than 64 bits; fall back to the stdlib encoder
+        return json.dumps(obj)
+
+
+# Runs of 20+ digits may be integers wider than 64 bits, which orjson parses as floats
+_WIDE_INT_RE = re.compile(rb"\d{20}")
+
+
+def _json_loads(body: bytes) -> Any:
+    if _WIDE_INT_RE.search(body):
+        # Keep wide integers exact with the stdlib decoder, mirroring _json_dumps
+        return json.loads(body)
+    return orjson.loads(body)
+
+
 class UniswapService:
     def __init__(self, api_key: str, base_url: str = "https://trade-api.gateway.uniswap.org/v1"):
         self.api_key = api_key
@@ -25,43 +58,75 @@ class UniswapService:
             7777777: "ZORA",
             42220: "CELO"
         }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        check_approval, get_quote and swap hit the same gateway host, so one pooled
+        session with the API key as a default header is reused across calls. A session only
+        works on the event loop that created it, and PluginBase may run each tool call on a
+        fresh loop, so a new session is created whenever the running loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                headers={"x-api-key": self.api_key},
+                json_serialize=_json_dumps,
+                connector=aiohttp.TCPConnector(limit_per_host=16, keepalive_timeout=90, ttl_dns_cache=300),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session.
+
+        A session left on another (possibly already closed) loop cannot be awaited from here,
+        so it is only dropped.
+        """
+        if (
+            self._session is not None
+            and not self._session.closed
+            and self._session_loop is asyncio.get_running_loop()
+        ):
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     async def make_request(self, endpoint: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Make a request to the Uniswap API."""
         url = f"{self.base_url}/{endpoint}"
         
-        headers = {
-            "x-api-key": self.api_key
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, json=parameters, headers=headers) as response:
-                    response_text = await response.text()
-                    try:
-                        response_json = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        raise Exception(f"Invalid JSON response from {endpoint}: {response_text}")
-                    
-                    print(f"\nAPI Response for {endpoint}:")
-                    print(f"Status: {response.status}")
-                    print(f"Headers: {dict(response.headers)}")
-                    print(f"Body: {response_text}")
-                    
-                    if not response.ok:
-                        error_code = response_json.get("errorCode", "Unknown error")
-                        if error_code == "VALIDATION_ERROR":
-                            raise Exception("Invalid parameters provided to the API")
-                        elif error_code == "INSUFFICIENT_BALANCE":
-                            raise Exception("Insufficient balance for the requested operation")
-                        elif error_code == "RATE_LIMIT":
-                            raise Exception("API rate limit exceeded")
-                        else:
-                            raise Exception(f"API error: {error_code}")
-                    
-                    return response_json
-            except aiohttp.ClientError as e:
-                raise Exception(f"Network error while accessing {endpoint}: {str(e)}")
+        session = await self._get_session()
+        try:
+            async with session.post(url, json=parameters) as response:
+                body = await response.read()
+                try:
+                    # Parse straight from the body bytes; the text is only needed to report bad JSON
+                    response_json = _json_loads(body)
+                except ValueError:
+                    raise Exception(f"Invalid JSON response from {endpoint}: {body.decode(errors='replace')}")
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "API response for %s: status=%s headers=%s body=%s",
+                        endpoint, response.status, dict(response.headers), response_json
+                    )
+                
+                if not response.ok:
+                    error_code = response_json.get("errorCode", "Unknown error")
+                    raise Exception(_UNISWAP_ERRORS.get(error_code, f"API error: {error_code}"))
+                
+                return response_json
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network error while accessing {endpoint}: {str(e)}")
 
     @Tool({
         "name": "uniswap_check_approval",
@@ -71,34 +136,11 @@ class UniswapService:
     async def check_approval(self, wallet_client: EVMWalletClient, parameters: dict):
         """Check token approval and approve if needed."""
         try:
-            data = await self.make_request("check_approval", {
-                "token": parameters["token"],
-                "amount": parameters["amount"],
-                "walletAddress": parameters["walletAddress"],
-                "chainId": wallet_client.get_chain()["id"]
-            })
+            transaction_params = await self._get_approval_transaction(wallet_client, parameters)
 
-            # If no approval data is returned, the token is already approved
-            if not data or "approval" not in data or not data["approval"]:
+            # If no approval transaction is needed, the token is already approved
+            if transaction_params is None:
                 return {"status": "approved"}
-
-            approval = data["approval"]
-            # Extract spender address from approval data
-            data = approval["data"]
-            # The spender address starts at position 34 (after function selector) and is 40 characters long
-            raw_spender = "0x" + data[34:74]
-            # Use wallet_client's resolve_address to get checksum address
-            spender = wallet_client.resolve_address(raw_spender)
-            # Convert max approval amount to integer
-            max_approval = int("0x" + "f" * 64, 16)  # Max uint256 value
-            
-            transaction_params: EVMTransaction = {
-                "to": wallet_client.resolve_address(approval["to"]),
-                "abi": ERC20_ABI,
-                "functionName": "approve",
-                "args": [spender, max_approval],
-                "value": 0
-            }
             
             # Send the transaction
             transaction = wallet_client.send_transaction(transaction_params)
@@ -109,6 +151,39 @@ class UniswapService:
         except Exception as error:
             raise Exception(f"Failed to check/approve token: {error}")
 
+    async def _get_approval_transaction(
+        self, wallet_client: EVMWalletClient, parameters: dict
+    ) -> Optional[EVMTransaction]:
+        """Build the approval transaction for a token, or None if it is already approved."""
+        data = await self.make_request("check_approval", {
+            "token": parameters["token"],
+            "amount": parameters["amount"],
+            "walletAddress": parameters["walletAddress"],
+            "chainId": wallet_client.get_chain()["id"]
+        })
+
+        # If no approval data is returned, the token is already approved
+        if not data or "approval" not in data or not data["approval"]:
+            return None
+
+        approval = data["approval"]
+        # Extract spender address from approval data
+        data = approval["data"]
+        # The spender address starts at position 34 (after function selector) and is 40 characters long
+        raw_spender = "0x" + data[34:74]
+        # Use wallet_client's resolve_address to get checksum address
+        spender = wallet_client.resolve_address(raw_spender)
+        # Convert max approval amount to integer
+        max_approval = int("0x" + "f" * 64, 16)  # Max uint256 value
+        
+        return {
+            "to": wallet_client.resolve_address(approval["to"]),
+            "abi": ERC20_ABI,
+            "functionName": "approve",
+            "args": [spender, max_approval],
+            "value": 0
+        }
+
     @Tool({
         "name": "uniswap_get_quote",
         "description": "Get the quote for a swap",
@@ -129,9 +204,8 @@ class UniswapService:
                 "swapper": wallet_client.get_address()
             }
             
-            # Debug log the request parameters
-            print(f"\nRequest parameters for quote:")
-            print(json.dumps(request_params, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request parameters for quote: %s", json.dumps(request_params, indent=2))
             
             return await self.make_request("quote", request_params)
         except Exception as error:
@@ -139,62 +213,133 @@ class UniswapService:
 
     @Tool({
         "name": "uniswap_swap_tokens",
-        "description": "Swap tokens on Uniswap",
+        "description": "Swap tokens on Uniswap. The input token must already be approved, see uniswap_check_approval",
         "parameters_schema": GetQuoteParameters
     })
     async def swap_tokens(self, wallet_client: EVMWalletClient, parameters: dict):
         """Execute a token swap on Uniswap."""
         try:
-            quote_response = await self.get_quote(wallet_client, parameters)
-            quote = quote_response["quote"]
-            permit_data = quote_response.get("permitData")
-
-            swap_params = {
-                "quote": quote,
-            }
-            
-            # Handle permit signature if permit data is present
-            if permit_data:
-                # Create properly typed data structure
-                typed_data: EVMTypedData = {
-                    "domain": permit_data["domain"],
-                    "types": permit_data["types"],
-                    "primaryType": list(permit_data["types"].keys())[0],
-                    "message": permit_data["values"]
-                }
-                signature = wallet_client.sign_typed_data(typed_data)
-
-                swap_params["permitData"] = permit_data
-                swap_params["signature"] = str(signature["signature"])
-
-            print(f"\nRequest parameters for swap:")
-            print(json.dumps(swap_params, indent=2))
-            
-            response = await self.make_request("swap", swap_params)
-            
-            swap = response["swap"]
-            # Create properly typed transaction object using raw API response
-            value = swap.get("value", "0x0")
-            # Convert hex value to integer for EVMTransaction
-            if isinstance(value, str) and value.startswith("0x"):
-                value = int(value, 16)
-            elif isinstance(value, str):
-                value = int(value)
-            else:
-                value = int(value) if value else 0
-            
-            # Create and cast the transaction parameters
-            transaction_params = cast(EVMTransaction, {
-                "to": wallet_client.resolve_address(swap["to"]),
-                "value": value,
-                "data": HexStr(swap["data"])
-            })
-            
-            # Send the transaction
-            transaction = wallet_client.send_transaction(transaction_params)
+            quote_response, approval_transaction = await self.prepare_swap(wallet_client, parameters)
+            if approval_transaction is not None:
+                raise Exception(
+                    "The input token is not approved for this swap, approve it with uniswap_check_approval first"
+                )
 
+            swap_transaction = await self._get_swap_transaction(wallet_client, quote_response)
+            transaction = wallet_client.send_transaction(swap_transaction)
             return {
                 "txHash": transaction["hash"]
             }
         except Exception as error:
             raise Exception(f"Failed to execute swap: {error}")
+
+    async def prepare_swap(
+        self, wallet_client: EVMWalletClient, parameters: dict
+    ) -> Tuple[Dict[str, Any], Optional[EVMTransaction]]:
+        """Fetch a swap quote and check the input token's approval. Nothing is sent.
+
+        The quote and the approval check are independent, so they run concurrently.
+
+        Returns:
+            The quote response, and the approval transaction still required (None if the
+            token is already approved)
+        """
+        quote_response, approval_transaction = await asyncio.gather(
+            self.get_quote(wallet_client, parameters),
+            self._get_approval_transaction(wallet_client, self._swap_approval_parameters(wallet_client, parameters))
+        )
+        return quote_response, approval_transaction
+
+    async def swap_with_approval(self, wallet_client: EVMWalletClient, parameters: dict):
+        """Approve the input token if needed and swap.
+
+        Library-only entry point, deliberately not exposed as a tool: agents approve explicitly
+        with uniswap_check_approval before calling uniswap_swap_tokens. The approval, when
+        needed, is an unlimited (max uint256) approve of the input token, the same one
+        uniswap_check_approval sends.
+
+        Smart wallets receive the approval and the swap as a single batch, saving one
+        confirmation round trip, so the quote is fetched alongside the approval check. Other
+        wallets send the approval first and only fetch the quote once it has confirmed, so the
+        swap is never built from a quote that went stale while waiting for the receipt.
+        """
+        if isinstance(wallet_client, EVMSmartWalletClient):
+            quote_response, approval_transaction = await self.prepare_swap(wallet_client, parameters)
+            swap_transaction = await self._get_swap_transaction(wallet_client, quote_response)
+            if approval_transaction is not None:
+                transaction = wallet_client.send_batch_of_transactions([approval_transaction, swap_transaction])
+            else:
+                transaction = wallet_client.send_transaction(swap_transaction)
+        else:
+            approval_transaction = await self._get_approval_transaction(
+                wallet_client, self._swap_approval_parameters(wallet_client, parameters)
+            )
+            if approval_transaction is not None:
+                approval = wallet_client.send_transaction(approval_transaction)
+                # A reverted approve would make the swap revert too, so stop before sending it
+                if approval.get("status") == "0":
+                    raise Exception(f"Token approval transaction {approval['hash']} reverted")
+
+            quote_response = await self.get_quote(wallet_client, parameters)
+            swap_transaction = await self._get_swap_transaction(wallet_client, quote_response)
+            transaction = wallet_client.send_transaction(swap_transaction)
+
+        return {
+            "txHash": transaction["hash"]
+        }
+
+    @staticmethod
+    def _swap_approval_parameters(wallet_client: EVMWalletClient, parameters: dict) -> dict:
+        """Approval check parameters for the input token of a swap."""
+        return {
+            "token": parameters["tokenIn"],
+            "amount": parameters["amount"],
+            "walletAddress": wallet_client.get_address()
+        }
+
+    async def _get_swap_transaction(self, wallet_client: EVMWalletClient, quote_response: dict) -> EVMTransaction:
+        """Build the swap transaction for a quote, signing its permit if one is required."""
+        quote = quote_response["quote"]
+        permit_data = quote_response.get("permitData")
+
+        swap_params = {
+            "quote": quote,
+        }
+        
+        # Handle permit signature if permit data is present
+        if permit_data:
+            # Create properly typed data structure
+            typed_data: EVMTypedData = {
+                "domain": permit_data["domain"],
+                "types": permit_data["types"],
+                "primaryType": list(permit_data["types"].keys())[0],
+                "message": permit_data["values"]
+            }
+            signature = wallet_client.sign_typed_data(typed_data)
+
+            swap_params["permitData"] = permit_data
+            swap_params["signature"] = str(signature["signature"])
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request parameters for swap: %s", json.dumps(swap_params, indent=2))
+        
+        response = await self.make_request("swap", swap_params)
+        
+        swap = response["swap"]
+        # Create properly typed transaction object using raw API response
+        value = swap.get("value", "0x0")
+        # Convert hex value to integer for EVMTransaction
+        if isinstance(value, str) and value.startswith("0x"):
+            value = int(value, 16)
+        elif isinstance(value, str):
+            value = int(value)
+        else:
+            value = int(value) if value else 0
+        
+        # Create and cast the transaction parameters
+        return cast(EVMTransaction, {
+            "to": wallet_client.resolve_address(swap["to"]),
+            "value": value,
+            "data": HexStr(swap["data"])
+        })
+
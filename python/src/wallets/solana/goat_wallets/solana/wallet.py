@@ -1,22 +1,99 @@
 from abc import abstractmethod
-from typing import Dict, Optional, TypedDict, List, Any
-
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Callable, Dict, Optional, Tuple, TypedDict, List, Any
+
+import asyncio
 import base64
+import logging
+import struct
+import threading
+import time
 from solana.rpc.api import Client as SolanaClient
 from solana.rpc.types import TxOpts
-from solana.rpc.commitment import Confirmed
-from solana.transaction import Transaction
+from solana.rpc.websocket_api import connect as ws_connect
+from solana.rpc.commitment import Commitment, Confirmed, Finalized, Processed
+from solders.hash import Hash
 from solders.pubkey import Pubkey
+from solders.signature import Signature as SolanaSignature
 from solders.keypair import Keypair
+from solders.rpc.responses import RpcBlockhash
 from solders.instruction import Instruction, AccountMeta, CompiledInstruction
 from solders.message import Message, MessageV0
 from solders.address_lookup_table_account import AddressLookupTableAccount
 from solders.transaction import VersionedTransaction
-import nacl.signing
+from solders.transaction_status import TransactionConfirmationStatus
 
 from goat.classes.wallet_client_base import Balance, Signature, WalletClientBase
 from goat.types.chain import Chain
 
+logger = logging.getLogger(__name__)
+
+LAMPORTS_PER_SOL = 10**9
+
+# Maximum number of accounts accepted by a single getMultipleAccounts RPC call
+MAX_MULTIPLE_ACCOUNTS = 100
+
+# On-chain lookup table accounts start with a fixed-size metadata header, followed by
+# the table's 32-byte addresses
+LOOKUP_TABLE_META_SIZE = 56
+
+# Number of parsed address lookup tables kept per wallet client
+LOOKUP_TABLE_CACHE_SIZE = 512
+
+# Number of compiled transaction messages kept per keypair wallet client
+MESSAGE_CACHE_SIZE = 128
+
+# Calls each secondary RPC endpoint may have in flight. A saturated (slow) endpoint is skipped
+# instead of queueing more work, so it can never hold up calls to the primary endpoint
+SECONDARY_MAX_IN_FLIGHT = 2
+# Race pool workers always left free for calls to the primary endpoint
+RACE_PRIMARY_WORKERS = 4
+
+# RPC-side retries are disabled; sends that error are retried client-side, and sends that are
+# accepted but dropped are rebroadcast until they confirm or their blockhash expires
+SEND_ATTEMPTS = 5
+SEND_RETRY_BASE_DELAY = 0.4  # seconds, doubled after every failed attempt
+RESEND_INTERVAL = 2  # seconds between rebroadcasts of an unconfirmed transaction
+# Rebroadcasts carry bytes that were already accepted once, so they are never re-simulated
+RESEND_OPTS = TxOpts(skip_preflight=True, max_retries=0)
+
+# How often the signature status is polled while waiting for confirmation
+CONFIRM_POLL_INTERVAL = 0.5
+# How long to wait for a websocket confirmation before falling back to polling
+WS_CONFIRM_TIMEOUT = 30
+
+# Confirmation statuses that satisfy each commitment level
+SATISFYING_STATUSES = {
+    Processed: (
+        TransactionConfirmationStatus.Processed,
+        TransactionConfirmationStatus.Confirmed,
+        TransactionConfirmationStatus.Finalized,
+    ),
+    Confirmed: (TransactionConfirmationStatus.Confirmed, TransactionConfirmationStatus.Finalized),
+    Finalized: (TransactionConfirmationStatus.Finalized,),
+}
+
+
+@lru_cache(maxsize=4096)
+def _pubkey_from_string(address: str) -> Pubkey:
+    """Parse a base58 address, memoized since the same lookup tables and accounts recur."""
+    return Pubkey.from_string(address)
+
+
+def _with_blockhash(message: MessageV0, recent_blockhash: Hash) -> MessageV0:
+    """Copy a compiled v0 message with a different recent blockhash."""
+    return MessageV0(
+        header=message.header,
+        account_keys=message.account_keys,
+        recent_blockhash=recent_blockhash,
+        instructions=message.instructions,
+        address_table_lookups=message.address_table_lookups,
+    )
+
 
 class SolanaTransaction(TypedDict):
     """Transaction parameters for Solana transactions."""
@@ -29,21 +106,104 @@ class SolanaTransaction(TypedDict):
 class SolanaOptions:
     """Configuration options for Solana wallet clients."""
 
-    def __init__(self):
-        pass
+    def __init__(self, skip_preflight: bool = False):
+        # Skipping preflight simulation saves the RPC a pass per send, but failing transactions
+        # then land on-chain and still pay fees instead of being rejected up front
+        self.skip_preflight = skip_preflight
 
 
 class SolanaWalletClient(WalletClientBase):
     """Base class for Solana wallet implementations."""
 
-    def __init__(self, client: SolanaClient):
+    def __init__(self, client: SolanaClient, additional_clients: Optional[List[SolanaClient]] = None):
         """Initialize the Solana wallet client.
 
         Args:
-            client: A Solana RPC client instance
+            client: A Solana RPC client instance, used as the primary endpoint
+            additional_clients: Optional clients for other RPC endpoints. Latency-sensitive reads
+                are raced across all endpoints and transactions are broadcast to all of them
         """
         super().__init__()
         self.client = client
+        self.clients = [client, *(additional_clients or [])]
+        # Lookup table contents are effectively immutable, so parsed tables are kept in an LRU
+        self._alt_cache: "OrderedDict[str, AddressLookupTableAccount]" = OrderedDict()
+        self._alt_cache_lock = threading.Lock()
+        # Shared pool for overlapping independent RPC calls (blockhash, lookup table chunks).
+        # The client's HTTP provider already keeps pooled keep-alive connections.
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Separate pool for calls spread across endpoints: its tasks never wait on other tasks, so
+        # callers running on self._executor can race without starving the pool. Secondary calls are
+        # capped per endpoint, which keeps RACE_PRIMARY_WORKERS free for the primary at all times
+        self._secondary_slots = [threading.BoundedSemaphore(SECONDARY_MAX_IN_FLIGHT) for _ in self.clients[1:]]
+        self._race_executor = (
+            ThreadPoolExecutor(max_workers=RACE_PRIMARY_WORKERS + SECONDARY_MAX_IN_FLIGHT * len(self._secondary_slots))
+            if self._secondary_slots
+            else None
+        )
+
+    def close(self):
+        """Shut down the RPC thread pools. The RPC clients belong to the caller and stay open."""
+        self._executor.shutdown(wait=False)
+        if self._race_executor is not None:
+            self._race_executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _race(self, method: str, *args, **kwargs) -> Any:
+        """Call a read-only RPC method on every available client and return the first successful response.
+
+        The primary client is always called; secondary clients are skipped while saturated with
+        earlier calls. Slower calls are left to finish in the background. Raises the last error if
+        every client fails.
+        """
+        if self._race_executor is None:
+            return getattr(self.client, method)(*args, **kwargs)
+
+        pending = {
+            self._race_executor.submit(getattr(self.client, method), *args, **kwargs),
+            *self._submit_to_secondaries(method, args, kwargs),
+        }
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error  # type: ignore[misc]
+
+    def _broadcast(self, method: str, *args, **kwargs) -> Any:
+        """Send a write to the primary client, and fire-and-forget to every available secondary.
+
+        Returns the primary's response without waiting on the secondaries, which are never
+        cancelled. If the primary fails, the first successful secondary response is returned
+        instead; the primary's error is raised if every client fails.
+        """
+        secondaries = self._submit_to_secondaries(method, args, kwargs)
+        try:
+            return getattr(self.client, method)(*args, **kwargs)
+        except Exception:
+            for future in as_completed(secondaries):
+                if future.exception() is None:
+                    return future.result()
+            raise
+
+    def _submit_to_secondaries(self, method: str, args: Tuple, kwargs: Dict[str, Any]) -> List[Future]:
+        """Submit an RPC call to every secondary client that has a free in-flight slot."""
+        futures = []
+        for client, slots in zip(self.clients[1:], self._secondary_slots):
+            # Skip endpoints still busy with earlier calls instead of queueing behind them
+            if not slots.acquire(blocking=False):
+                continue
+            future = self._race_executor.submit(getattr(client, method), *args, **kwargs)  # type: ignore[union-attr]
+            future.add_done_callback(lambda _, slots=slots: slots.release())
+            futures.append(future)
+        return futures
 
     def get_chain(self) -> Chain:
         """Get the chain type for Solana."""
@@ -59,17 +219,50 @@ class SolanaWalletClient(WalletClientBase):
         """Sign a message with the wallet's private key."""
         pass
 
+    def verify_signatures_batch(self, messages: List[str], signatures: List[str], addresses: List[str]) -> List[bool]:
+        """Verify many message signatures in one call.
+
+        Accepts signatures in the format produced by sign_message (hex-encoded Ed25519).
+        Verification currently runs sequentially in Rust via solders, which does not
+        expose a batch verifier; callers get a single entry point that can switch to true
+        batch verification without changing.
+
+        Args:
+            messages: The signed messages
+            signatures: Hex-encoded signatures, one per message
+            addresses: Base58 public keys of the signers, one per message
+
+        Returns:
+            One boolean per message, True if its signature is valid
+        """
+        if not len(messages) == len(signatures) == len(addresses):
+            raise ValueError("messages, signatures and addresses must have the same length")
+
+        results = []
+        for message, signature, address in zip(messages, signatures, addresses):
+            try:
+                sig = SolanaSignature.from_bytes(bytes.fromhex(signature))
+                results.append(sig.verify(_pubkey_from_string(address), message.encode("utf-8")))
+            except ValueError:
+                # Malformed signature or address
+                results.append(False)
+        return results
+
     @abstractmethod
     def balance_of(self, address: str) -> Balance:
         """Get the SOL balance of an address."""
         pass
 
     @abstractmethod
-    def send_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:
+    def send_transaction(self, transaction: SolanaTransaction, commitment: Commitment = Confirmed) -> Dict[str, str]:
         """Send a transaction on the Solana chain.
 
         Args:
             transaction: Transaction parameters including instructions and optional lookup tables
+            commitment: Commitment level to wait for before returning. Confirmed (the default)
+                waits for a supermajority vote; Processed returns as soon as the transaction
+                lands in a block, roughly a slot sooner, but that block can still be dropped;
+                Finalized waits for full finality
 
         Returns:
             Dict containing the transaction hash
@@ -77,11 +270,12 @@ class SolanaWalletClient(WalletClientBase):
         pass
 
     @abstractmethod
-    def send_raw_transaction(self, transaction: str) -> Dict[str, str]:
+    def send_raw_transaction(self, transaction: str, commitment: Commitment = Confirmed) -> Dict[str, str]:
         """Send a raw transaction on the Solana chain.
 
         Args:
             transaction: Base64 encoded transaction string
+            commitment: Commitment level to wait for before returning, see send_transaction
 
         Returns:
             Dict containing the transaction hash
@@ -89,52 +283,58 @@ class SolanaWalletClient(WalletClientBase):
         pass
 
 
-    def _decompile_instruction(self, compiled_ix: CompiledInstruction, account_keys: list[Pubkey], message: Message) -> Optional[Instruction]:
+    def _account_flags(self, message: Message, num_accounts: int) -> Tuple[List[bool], List[bool]]:
+        """Compute the signer and writable flags of every account index in a message.
+
+        Done once per message so decompiling instructions only needs list lookups instead of
+        a call into solders per account reference.
+        """
+        is_signer = [message.is_signer(idx) for idx in range(num_accounts)]
+        # Handle both Message and MessageV0 types
+        if isinstance(message, MessageV0):
+            is_writable = [message.is_maybe_writable(idx) for idx in range(num_accounts)]
+        else:
+            # For legacy messages, check if it's in the writable accounts range
+            header = message.header
+            num_required_signatures = header.num_required_signatures
+            num_writable_signed = num_required_signatures - header.num_readonly_signed_accounts
+            num_writable_unsigned_end = num_accounts - header.num_readonly_unsigned_accounts
+            is_writable = [
+                idx < num_writable_signed or num_required_signatures <= idx < num_writable_unsigned_end
+                for idx in range(num_accounts)
+            ]
+        return is_signer, is_writable
+
+    def _decompile_instruction(
+        self,
+        compiled_ix: CompiledInstruction,
+        account_keys: list[Pubkey],
+        is_signer: List[bool],
+        is_writable: List[bool],
+    ) -> Optional[Instruction]:
+        # Get program id from the account keys
         try:
-            # Get program id from the account keys
             program_id = account_keys[compiled_ix.program_id_index]
-            
-            # Transform account indexes into AccountMeta objects
-            accounts = []
-            for idx in compiled_ix.accounts:
-                try:
-                    pubkey = account_keys[idx]
-                    # You might need to check header/message metadata to determine 
-                    # if the account is writable/signer
-                    is_signer = message.is_signer(idx)
-                    # Handle both Message and MessageV0 types
-                    if isinstance(message, MessageV0):
-                        is_writable = message.is_maybe_writable(idx)
-                    else:
-                        # For legacy messages, check if it's in the writable accounts range
-                        header = message.header
-                        num_required_signatures = header.num_required_signatures
-                        num_readonly_signed = header.num_readonly_signed_accounts
-                        num_readonly_unsigned = header.num_readonly_unsigned_accounts
-                        
-                        if idx < (num_required_signatures - num_readonly_signed):
-                            is_writable = True
-                        elif idx < num_required_signatures:
-                            is_writable = False
-                        elif idx < (len(account_keys) - num_readonly_unsigned):
-                            is_writable = True
-                        else:
-                            is_writable = False
-                            
-                    accounts.append(AccountMeta(pubkey, is_signer=is_signer, is_writable=is_writable))
-                except IndexError:
-                    print(f"Could not find account at index {idx}")
-                    return None
-            
-            return Instruction(
-                program_id=program_id,
-                accounts=accounts,
-                data=compiled_ix.data
-            )
         except IndexError:
             print(f"Could not find program id at index {compiled_ix.program_id_index}")
             return None
 
+        # Transform account indexes into AccountMeta objects
+        try:
+            accounts = [
+                AccountMeta(account_keys[idx], is_signer[idx], is_writable[idx]) for idx in compiled_ix.accounts
+            ]
+        except IndexError:
+            missing_idx = next(idx for idx in compiled_ix.accounts if idx >= len(account_keys))
+            print(f"Could not find account at index {missing_idx}")
+            return None
+
+        return Instruction(
+            program_id=program_id,
+            accounts=accounts,
+            data=compiled_ix.data
+        )
+
     def decompile_versioned_transaction_to_instructions(self, versioned_transaction: VersionedTransaction) -> Optional[List[Instruction]]:
         """Decompile a versioned transaction into its constituent instructions.
 
@@ -177,100 +377,165 @@ class SolanaWalletClient(WalletClientBase):
         else:
             account_keys = message.account_keys
 
-        instructions = []
-        for compiled_ix in message.instructions:
-            ix = self._decompile_instruction(compiled_ix, account_keys, message)
-            if ix is not None:
-                instructions.append(ix)
+        is_signer, is_writable = self._account_flags(message, len(account_keys))
+
+        decompiled = (
+            self._decompile_instruction(compiled_ix, account_keys, is_signer, is_writable)
+            for compiled_ix in message.instructions
+        )
+        instructions = [ix for ix in decompiled if ix is not None]
 
         return instructions
 
     def get_address_lookup_table_accounts(self, keys: List[str]) -> List[AddressLookupTableAccount]:
         """Get address lookup table accounts for the given addresses.
 
+        Tables are served from a per-client LRU cache when possible; only cache misses are
+        fetched from the RPC.
+
         Args:
             addresses: List of lookup table addresses
 
         Returns:
             List of address lookup table accounts
         """
-        lookup_table_accounts = []
-        
-        for key in keys:
-            # Convert address to Pubkey
-            pubkey = Pubkey.from_string(key)
-            
-            # Get account info
-            try:
-                account_info = self.client.get_account_info(pubkey).value
-            except Exception as e:
-                print(f"Error getting account info for {key}: {e}")
-                account_info = None
-            
-            if account_info is not None:
-                try:
-                    # The account data comes as base64, need to decode it first
-                    decoded_data = base64.b64decode(account_info.data)
-                    lookup_table_account = AddressLookupTableAccount.from_bytes(decoded_data)
-                    lookup_table_accounts.append(lookup_table_account)
-                except Exception as e:
-                    print(f"Error decoding lookup table for {key}: {e}")
-                    lookup_table_accounts.append(None)
-            else:
-                lookup_table_accounts.append(None)
-                
-        return lookup_table_accounts
+        # Held across the fetch so concurrent callers don't request the same tables twice
+        with self._alt_cache_lock:
+            tables: Dict[str, Optional[AddressLookupTableAccount]] = {}
+            for key in keys:
+                table = self._alt_cache.get(key)
+                if table is not None:
+                    self._alt_cache.move_to_end(key)
+                    tables[key] = table
+
+            misses = [key for key in dict.fromkeys(keys) if key not in tables]
+            if misses:
+                for key, table in zip(misses, self._fetch_address_lookup_table_accounts(misses)):
+                    tables[key] = table
+                    if table is not None:
+                        self._alt_cache[key] = table
+                while len(self._alt_cache) > LOOKUP_TABLE_CACHE_SIZE:
+                    self._alt_cache.popitem(last=False)
+
+        return [tables[key] for key in keys]
+
+    def _fetch_accounts_chunk(self, pubkeys: List[Pubkey]) -> List[Optional[Any]]:
+        """Fetch one getMultipleAccounts chunk, returning None for every account on failure."""
+        try:
+            return list(self._race("get_multiple_accounts", pubkeys).value)
+        except Exception as e:
+            logger.warning("Error getting account info for %s: %s", [str(pubkey) for pubkey in pubkeys], e)
+            return [None] * len(pubkeys)
+
+    def _fetch_address_lookup_table_accounts(self, keys: List[str]) -> List[Optional[AddressLookupTableAccount]]:
+        """Fetch and parse address lookup table accounts from the RPC, None for missing tables."""
+        pubkeys = [_pubkey_from_string(key) for key in keys]
+
+        # Fetch all tables with getMultipleAccounts, one request per RPC-sized chunk, run concurrently
+        chunks = [
+            pubkeys[start : start + MAX_MULTIPLE_ACCOUNTS] for start in range(0, len(pubkeys), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        account_infos = []
+        for chunk_infos in self._executor.map(self._fetch_accounts_chunk, chunks):
+            account_infos.extend(chunk_infos)
+
+        # Results stay positionally aligned with keys, missing tables included
+        return [
+            self._parse_lookup_table(key, account_info) if account_info is not None else None
+            for key, account_info in zip(keys, account_infos)
+        ]
+
+    def _parse_lookup_table(self, key: str, account_info: Any) -> Optional[AddressLookupTableAccount]:
+        """Decode a lookup table account, None if its data is malformed."""
+        try:
+            # solana-py already returns the decoded account bytes; the on-chain layout is not the
+            # bincode AddressLookupTableAccount.from_bytes expects, so slice the addresses out
+            data = bytes(account_info.data)
+            if len(data) < LOOKUP_TABLE_META_SIZE or (len(data) - LOOKUP_TABLE_META_SIZE) % 32:
+                raise ValueError(f"unexpected lookup table account size {len(data)}")
+            addresses = [Pubkey.from_bytes(data[i : i + 32]) for i in range(LOOKUP_TABLE_META_SIZE, len(data), 32)]
+            return AddressLookupTableAccount(key=_pubkey_from_string(key), addresses=addresses)
+        except Exception as e:
+            logger.warning("Error decoding lookup table for %s: %s", key, e)
+            return None
 
 
 class SolanaKeypairWalletClient(SolanaWalletClient):
     """Solana wallet implementation using a keypair."""
 
-    def __init__(self, client: SolanaClient, keypair: Keypair):
+    def __init__(
+        self,
+        client: SolanaClient,
+        keypair: Keypair,
+        ws_url: Optional[str] = None,
+        additional_clients: Optional[List[SolanaClient]] = None,
+        options: Optional[SolanaOptions] = None,
+    ):
         """Initialize the Solana keypair wallet client.
 
         Args:
             client: A Solana RPC client instance
             keypair: A Solana keypair for signing transactions
+            ws_url: Optional RPC websocket URL. When set, confirmations are pushed via
+                signatureSubscribe instead of polled
+            additional_clients: Optional clients for other RPC endpoints to race reads and
+                broadcast transactions across
+            options: Optional configuration, see SolanaOptions
         """
-        super().__init__(client)
+        super().__init__(client, additional_clients)
         self.keypair = keypair
+        options = options or SolanaOptions()
+        self._send_opts = TxOpts(skip_preflight=options.skip_preflight, max_retries=0, preflight_commitment=Confirmed)
+        # The public key never changes, so derive it and its base58 form once
+        self._pubkey = keypair.pubkey()
+        self._address = str(self._pubkey)
+        # Websocket confirmations run on a background event loop so the public API stays synchronous
+        self._ws_url = ws_url
+        self._ws_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws_thread: Optional[threading.Thread] = None
+        self._ws_loop_lock = threading.Lock()
+        # Compiled messages keyed by a digest of their instructions and lookup tables
+        self._msg_cache: "OrderedDict[bytes, MessageV0]" = OrderedDict()
+        self._msg_cache_lock = threading.Lock()
+
+    def close(self):
+        """Stop the websocket confirmation loop and shut down the RPC thread pools."""
+        with self._ws_loop_lock:
+            loop, thread = self._ws_loop, self._ws_thread
+            self._ws_loop, self._ws_thread = None, None
+        if loop is not None and thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        super().close()
 
     def get_address(self) -> str:
         """Get the wallet's public address."""
-        return str(self.keypair.pubkey())
+        return self._address
 
     def sign_message(self, message: str) -> Signature:
         """Sign a message with the wallet's private key."""
-        message_bytes = message.encode("utf-8")
-        signed = nacl.signing.SigningKey(self.keypair.secret()).sign(message_bytes)
-        return {"signature": signed.signature.hex()}
+        signature = self.keypair.sign_message(message.encode("utf-8"))
+        return {"signature": bytes(signature).hex()}
 
     def balance_of(self, address: str) -> Balance:
         """Get the SOL balance of an address."""
-        pubkey = Pubkey.from_string(address)
+        pubkey = _pubkey_from_string(address)
         balance_lamports = self.client.get_balance(pubkey).value
-        # Convert lamports (1e9 lamports in 1 SOL)
+        # Convert lamports (1e9 lamports in 1 SOL) with integer math to keep every digit
+        whole, fraction = divmod(balance_lamports, LAMPORTS_PER_SOL)
         return {
             "decimals": 9,
             "symbol": "SOL",
             "name": "Solana",
-            "value": str(balance_lamports / 10**9),
+            "value": f"{whole}.{fraction:09d}".rstrip("0").rstrip("."),
             "in_base_units": str(balance_lamports),
         }
 
-    def send_transaction(self, transaction: SolanaTransaction) -> Dict[str, str]:
+    def send_transaction(self, transaction: SolanaTransaction, commitment: Commitment = Confirmed) -> Dict[str, str]:
         """Send a transaction on the Solana chain."""
-        # Get latest blockhash
-        recent_blockhash = self.client.get_latest_blockhash().value.blockhash
-
-        # Create transaction
-        tx = Transaction()
-        tx.recent_blockhash = recent_blockhash
-        tx.fee_payer = self.keypair.pubkey()
-
-        # Add instructions
-        for instruction in transaction["instructions"]:
-            tx.add(instruction)
+        # Fetch the latest blockhash while the transaction is assembled locally
+        blockhash_future = self._executor.submit(self._race, "get_latest_blockhash")
 
         # Add signers
         signers = [self.keypair]
@@ -278,78 +543,293 @@ class SolanaKeypairWalletClient(SolanaWalletClient):
         if additional_signers is not None:
             signers.extend(additional_signers)
 
-        # Sign and send transaction
-        tx.sign(*signers)
-        result = self.client.send_transaction(
-            tx,
-            *signers,
-            opts=TxOpts(
-                skip_preflight=False,
-                max_retries=10,
-                preflight_commitment=Confirmed,
-            ),
-        )
+        # Compile a v0 message once, then stamp each attempt's blockhash into it and sign
+        message = self._compile_message(transaction)
 
-        # Wait for confirmation
-        self.client.confirm_transaction(
-            result.value,
-            commitment=Confirmed,
-        )
+        def build(recent_blockhash: Hash) -> VersionedTransaction:
+            return VersionedTransaction(_with_blockhash(message, recent_blockhash), signers)
 
-        return {"hash": str(result.value)}
+        signature = self._send_and_confirm(build, blockhash_future.result().value, commitment)
 
-    def send_raw_transaction(self, transaction: str) -> Dict[str, str]:
+        return {"hash": str(signature)}
+
+    def send_raw_transaction(self, transaction: str, commitment: Commitment = Confirmed) -> Dict[str, str]:
         """Send a raw transaction on the Solana chain.
         
         Args:
             transaction: Base64 encoded transaction string
+            commitment: Commitment level to wait for before returning
             
         Returns:
             Dict containing the transaction hash
         """
+        # Fetch the latest blockhash while the transaction is decoded locally
+        blockhash_future = self._executor.submit(self._race, "get_latest_blockhash")
+
         # Deserialize the transaction from base64
         tx = VersionedTransaction.from_bytes(base64.b64decode(transaction))
         
-        # Get latest blockhash
-        recent_blockhash = self.client.get_latest_blockhash().value.blockhash
-        
         # Create new message with updated blockhash
-        new_message = MessageV0(
-            header=tx.message.header,
-            account_keys=tx.message.account_keys,
-            recent_blockhash=recent_blockhash,
-            instructions=tx.message.instructions,
-            address_table_lookups=tx.message.address_table_lookups
-        )
-        tx = VersionedTransaction(new_message, [self.keypair])
-        
-        # Send the transaction
-        result = self.client.send_transaction(
-            tx,
-            opts=TxOpts(
-                skip_preflight=False,
-                max_retries=10,
-                preflight_commitment=Confirmed,
-            ),
-        )
+        def build(recent_blockhash: Hash) -> VersionedTransaction:
+            return VersionedTransaction(_with_blockhash(tx.message, recent_blockhash), [self.keypair])
         
-        # Wait for confirmation
-        self.client.confirm_transaction(
-            result.value,
-            commitment=Confirmed,
+        signature = self._send_and_confirm(build, blockhash_future.result().value, commitment)
+
+        return {"hash": str(signature)}
+
+    def make_sender(
+        self,
+        instruction: Instruction,
+        data_format: str,
+        address_lookup_table_addresses: Optional[List[str]] = None,
+        commitment: Commitment = Confirmed,
+    ) -> Callable[..., Dict[str, str]]:
+        """Build a fast sender for an instruction that is sent repeatedly with varying arguments.
+
+        The template instruction's data is treated as a fixed prefix (e.g. an instruction
+        discriminator), followed by arguments packed with a struct format string. The message
+        is compiled once up front; every call only packs the arguments into the instruction
+        data, stamps a fresh blockhash, signs and broadcasts.
+
+        Args:
+            instruction: Template instruction providing the program, accounts and data prefix
+            data_format: struct format for the per-call arguments, e.g. "<Q" for a u64 amount
+            address_lookup_table_addresses: Optional lookup tables to compress accounts with
+            commitment: Commitment level each send waits for before returning
+
+        Returns:
+            A function taking the values to pack and returning a dict with the transaction hash
+        """
+        packer = struct.Struct(data_format)
+        prefix = bytes(instruction.data)
+
+        # Compile against placeholder data of the right length; only the data changes per call
+        placeholder = Instruction(instruction.program_id, prefix + bytes(packer.size), instruction.accounts)
+        message = self._compile_message(
+            {
+                "instructions": [placeholder],
+                "address_lookup_table_addresses": address_lookup_table_addresses,
+                "accounts_to_sign": None,
+            }
         )
-        
-        return {"hash": str(result.value)}
+        header, account_keys = message.header, message.account_keys
+        address_table_lookups = message.address_table_lookups
+        program_id_index = message.instructions[0].program_id_index
+        accounts = message.instructions[0].accounts
+        signers = [self.keypair]
+
+        def send(*args: Any) -> Dict[str, str]:
+            blockhash_future = self._executor.submit(self._race, "get_latest_blockhash")
+            compiled_ix = CompiledInstruction(program_id_index, prefix + packer.pack(*args), accounts)
 
+            def build(recent_blockhash: Hash) -> VersionedTransaction:
+                return VersionedTransaction(
+                    MessageV0(header, account_keys, recent_blockhash, [compiled_ix], address_table_lookups), signers
+                )
 
-def solana(client: SolanaClient, keypair: Keypair) -> SolanaKeypairWalletClient:
+            signature = self._send_and_confirm(build, blockhash_future.result().value, commitment)
+            return {"hash": str(signature)}
+
+        return send
+
+    def _compile_message(self, transaction: SolanaTransaction) -> MessageV0:
+        """Compile a transaction's instructions into a v0 message, reusing earlier compilations.
+
+        Bots tend to resend the same instructions with only the blockhash changing, so compiled
+        messages are cached by a digest of the serialized instructions and lookup table
+        addresses. The payer is always this wallet, so it does not need to be part of the key.
+        The cached message carries a placeholder blockhash that callers must replace.
+
+        Args:
+            transaction: The transaction to compile
+
+        Returns:
+            The compiled message
+        """
+        lookup_table_addresses = transaction.get("address_lookup_table_addresses") or []
+        digest = blake2b(digest_size=16)
+        for instruction in transaction["instructions"]:
+            digest.update(bytes(instruction))
+        for address in lookup_table_addresses:
+            digest.update(bytes(_pubkey_from_string(address)))
+        key = digest.digest()
+
+        with self._msg_cache_lock:
+            message = self._msg_cache.get(key)
+            if message is not None:
+                self._msg_cache.move_to_end(key)
+                return message
+
+        # Resolve lookup tables so their accounts are compressed out of the message. Compiling
+        # without a requested table would silently drop that compression, so it is an error
+        lookup_tables = self.get_address_lookup_table_accounts(lookup_table_addresses)
+        missing = [address for address, table in zip(lookup_table_addresses, lookup_tables) if table is None]
+        if missing:
+            raise Exception(f"Failed to resolve address lookup tables: {', '.join(missing)}")
+        message = MessageV0.try_compile(self._pubkey, transaction["instructions"], lookup_tables, Hash.default())
+
+        with self._msg_cache_lock:
+            self._msg_cache[key] = message
+            while len(self._msg_cache) > MESSAGE_CACHE_SIZE:
+                self._msg_cache.popitem(last=False)
+        return message
+
+    def _send_and_confirm(
+        self, build: Callable[[Hash], VersionedTransaction], latest_blockhash: RpcBlockhash, commitment: Commitment
+    ) -> SolanaSignature:
+        """Send a transaction and wait until it reaches the given commitment.
+
+        Args:
+            build: Builds the signed transaction for a given blockhash
+            latest_blockhash: The blockhash to build the first attempt with, and its expiry height
+            commitment: Commitment level to wait for
+
+        Returns:
+            The transaction signature
+        """
+        raw, signature, last_valid_block_height = self._send_with_retry(build, latest_blockhash)
+        self._confirm(signature, raw, last_valid_block_height, commitment)
+        return signature
+
+    def _send_with_retry(
+        self, build: Callable[[Hash], VersionedTransaction], latest_blockhash: RpcBlockhash
+    ) -> Tuple[bytes, SolanaSignature, int]:
+        """Submit a transaction, retrying client-side with exponential backoff when the RPC errors.
+
+        The transaction is only rebuilt (and re-signed) against a fresh blockhash when preflight
+        reports the current one as not found; other preflight failures are raised immediately.
+        Otherwise the identical signed bytes are resent, which cannot execute twice. A retry
+        rejected as already processed means an earlier attempt landed even though its response
+        was lost, so it counts as sent.
+
+        Args:
+            build: Builds the signed transaction for a given blockhash
+            latest_blockhash: The blockhash to build the first attempt with, and its expiry height
+
+        Returns:
+            The signed bytes that were accepted, their signature and the last block height at
+            which they can still land
+        """
+        raw = bytes(build(latest_blockhash.blockhash))
+        for attempt in range(SEND_ATTEMPTS):
+            try:
+                # Broadcast to every endpoint; they all return the same signature
+                signature = self._broadcast("send_raw_transaction", raw, opts=self._send_opts).value
+                return raw, signature, latest_blockhash.last_valid_block_height
+            except Exception as error:
+                message = str(error)
+                if "already been processed" in message or "AlreadyProcessed" in message:
+                    signature = VersionedTransaction.from_bytes(raw).signatures[0]
+                    return raw, signature, latest_blockhash.last_valid_block_height
+                blockhash_not_found = "BlockhashNotFound" in message or "Blockhash not found" in message
+                if attempt == SEND_ATTEMPTS - 1 or ("simulation failed" in message and not blockhash_not_found):
+                    raise
+                time.sleep(SEND_RETRY_BASE_DELAY * 2**attempt)
+                if blockhash_not_found:
+                    latest_blockhash = self._race("get_latest_blockhash").value
+                    raw = bytes(build(latest_blockhash.blockhash))
+        raise AssertionError("unreachable")
+
+    def _confirm(self, signature: SolanaSignature, raw: bytes, last_valid_block_height: int, commitment: Commitment):
+        """Wait for a transaction to reach the commitment and raise if it failed on-chain.
+
+        Leaders drop transactions under load and RPC-side retries are disabled, so the signed
+        bytes are rebroadcast every RESEND_INTERVAL seconds until the transaction lands or its
+        blockhash expires. Raises if it expires without landing.
+        """
+        satisfying = SATISFYING_STATUSES[commitment]
+        ws_future = None
+        if self._ws_url is not None:
+            ws_future = asyncio.run_coroutine_threadsafe(
+                self._wait_for_signature(signature, commitment), self._get_ws_loop()
+            )
+            ws_deadline = time.monotonic() + WS_CONFIRM_TIMEOUT
+        next_resend = time.monotonic() + RESEND_INTERVAL
+
+        while True:
+            if ws_future is not None:
+                try:
+                    err = ws_future.result(timeout=CONFIRM_POLL_INTERVAL)
+                    break
+                except FutureTimeoutError:
+                    if time.monotonic() > ws_deadline:
+                        ws_future.cancel()
+                        ws_future = None
+                        logger.warning("No websocket confirmation for %s, falling back to polling", signature)
+                except Exception as error:
+                    ws_future = None
+                    logger.warning(
+                        "Websocket confirmation failed for %s, falling back to polling: %s", signature, error
+                    )
+            else:
+                status = self.client.get_signature_statuses([signature]).value[0]
+                if status is not None and (status.err is not None or status.confirmation_status in satisfying):
+                    err = status.err
+                    break
+                time.sleep(CONFIRM_POLL_INTERVAL)
+
+            if time.monotonic() >= next_resend:
+                next_resend = time.monotonic() + RESEND_INTERVAL
+                if self.client.get_block_height().value <= last_valid_block_height:
+                    try:
+                        self._broadcast("send_raw_transaction", raw, opts=RESEND_OPTS)
+                    except Exception as error:
+                        logger.debug("Rebroadcast of %s failed: %s", signature, error)
+                elif self.client.get_signature_statuses([signature]).value[0] is None:
+                    raise Exception(f"Transaction {signature} expired before it was confirmed")
+
+        if err is not None:
+            raise Exception(f"Transaction {signature} failed: {err}")
+
+    async def _wait_for_signature(self, signature: SolanaSignature, commitment: Commitment) -> Any:
+        """Wait for a signatureSubscribe notification and return the transaction error, if any."""
+        async with ws_connect(self._ws_url) as websocket:
+            await websocket.signature_subscribe(signature, commitment=commitment)
+            await websocket.recv()  # subscription acknowledgement
+
+            # The transaction may have been confirmed before the subscription was active,
+            # in which case no notification will arrive. The HTTP client is synchronous, so the
+            # check runs off the loop to avoid blocking other in-flight confirmations
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.client.get_signature_statuses, [signature]
+            )
+            status = response.value[0]
+            satisfying = SATISFYING_STATUSES[commitment]
+            if status is not None and (status.err is not None or status.confirmation_status in satisfying):
+                return status.err
+
+            notification = (await websocket.recv())[0]
+            return notification.result.value.err
+
+    def _get_ws_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop used for websocket confirmations, starting it on first use."""
+        with self._ws_loop_lock:
+            if self._ws_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="solana-ws-confirm", daemon=True)
+                thread.start()
+                self._ws_loop, self._ws_thread = loop, thread
+            return self._ws_loop
+
+
+def solana(
+    client: SolanaClient,
+    keypair: Keypair,
+    ws_url: Optional[str] = None,
+    additional_clients: Optional[List[SolanaClient]] = None,
+    options: Optional[SolanaOptions] = None,
+) -> SolanaKeypairWalletClient:
     """Create a new SolanaKeypairWalletClient instance.
 
     Args:
         client: A Solana RPC client instance
         keypair: A Solana keypair for signing transactions
+        ws_url: Optional RPC websocket URL used to confirm transactions via signatureSubscribe
+        additional_clients: Optional clients for other RPC endpoints to race reads and
+            broadcast transactions across
+        options: Optional configuration, see SolanaOptions
 
     Returns:
         A new SolanaKeypairWalletClient instance
     """
-    return SolanaKeypairWalletClient(client, keypair)
+    return SolanaKeypairWalletClient(client, keypair, ws_url, additional_clients, options)
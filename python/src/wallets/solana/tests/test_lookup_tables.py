@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+from solders.address_lookup_table_account import AddressLookupTableAccount
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+
+from goat_wallets.solana import SolanaKeypairWalletClient
+
+
+def raw_lookup_table(addresses):
+    """Build lookup table account data in its on-chain layout: a 56-byte header, then the addresses."""
+    return bytes(56) + b"".join(bytes(address) for address in addresses)
+
+
+class FakeClient:
+    """Serves getMultipleAccounts from a dict of account data, recording every request."""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.requests = []
+
+    def get_multiple_accounts(self, pubkeys):
+        self.requests.append(list(pubkeys))
+        return SimpleNamespace(
+            value=[
+                SimpleNamespace(data=self.accounts[pubkey]) if pubkey in self.accounts else None
+                for pubkey in pubkeys
+            ]
+        )
+
+
+def test_lookup_tables_are_parsed_from_the_on_chain_layout():
+    first_key, second_key, missing_key = Pubkey.new_unique(), Pubkey.new_unique(), Pubkey.new_unique()
+    first_addresses = [Pubkey.new_unique() for _ in range(3)]
+    second_addresses = [Pubkey.new_unique()]
+    client = FakeClient(
+        {first_key: raw_lookup_table(first_addresses), second_key: raw_lookup_table(second_addresses)}
+    )
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    keys = [str(first_key), str(missing_key), str(second_key), str(first_key)]
+    tables = wallet.get_address_lookup_table_accounts(keys)
+
+    # Results stay aligned with the requested keys, duplicates and missing tables included
+    first_table = AddressLookupTableAccount(key=first_key, addresses=first_addresses)
+    assert tables == [
+        first_table,
+        None,
+        AddressLookupTableAccount(key=second_key, addresses=second_addresses),
+        first_table,
+    ]
+    # Duplicate keys are only requested once
+    assert client.requests == [[first_key, missing_key, second_key]]
+    wallet.close()
+
+
+def test_parsed_lookup_tables_are_cached_but_missing_ones_are_refetched():
+    table_key, missing_key = Pubkey.new_unique(), Pubkey.new_unique()
+    client = FakeClient({table_key: raw_lookup_table([Pubkey.new_unique()])})
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    wallet.get_address_lookup_table_accounts([str(table_key), str(missing_key)])
+    tables = wallet.get_address_lookup_table_accounts([str(table_key), str(missing_key)])
+
+    assert tables[0] is not None and tables[1] is None
+    assert client.requests == [[table_key, missing_key], [missing_key]]
+    wallet.close()
+
+
+def test_malformed_lookup_table_is_treated_as_missing():
+    table_key = Pubkey.new_unique()
+    # A partial trailing address makes the account size inconsistent with the layout
+    client = FakeClient({table_key: raw_lookup_table([Pubkey.new_unique()]) + bytes(5)})
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    assert wallet.get_address_lookup_table_accounts([str(table_key)]) == [None]
+    wallet.close()
+
+
+def test_empty_lookup_table_has_no_addresses():
+    table_key = Pubkey.new_unique()
+    client = FakeClient({table_key: raw_lookup_table([])})
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    assert wallet.get_address_lookup_table_accounts([str(table_key)]) == [
+        AddressLookupTableAccount(key=table_key, addresses=[])
+    ]
+    wallet.close()
@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+
+import pytest
+from solana.rpc.core import RPCException
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import VersionedTransaction
+from solders.transaction_status import TransactionConfirmationStatus
+
+import goat_wallets.solana.wallet as wallet_module
+from goat_wallets.solana import SolanaKeypairWalletClient
+
+
+class FakeClient:
+    """Simulates an RPC node where accepted transactions land once `land_on_send` sends were made.
+
+    `send_errors` are raised by successive sends (after the send has been recorded), and the
+    block height advances by `block_step` every time it is queried.
+    """
+
+    def __init__(self, send_errors=(), land_on_send=1, last_valid_block_height=100, block_step=0):
+        self.send_errors = list(send_errors)
+        self.land_on_send = land_on_send
+        self.last_valid_block_height = last_valid_block_height
+        self.block_height = 50
+        self.block_step = block_step
+        self.sent = []
+        self.landed = set()
+
+    def get_latest_blockhash(self):
+        return SimpleNamespace(
+            value=SimpleNamespace(blockhash=Hash.new_unique(), last_valid_block_height=self.last_valid_block_height)
+        )
+
+    def send_raw_transaction(self, raw, opts=None):
+        self.sent.append(raw)
+        signature = signature_of(raw)
+        if self.land_on_send is not None and len(self.sent) >= self.land_on_send:
+            self.landed.add(signature)
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        return SimpleNamespace(value=signature)
+
+    def get_signature_statuses(self, signatures):
+        status = None
+        if signatures[0] in self.landed:
+            status = SimpleNamespace(err=None, confirmation_status=TransactionConfirmationStatus.Confirmed)
+        return SimpleNamespace(value=[status])
+
+    def get_block_height(self):
+        self.block_height += self.block_step
+        return SimpleNamespace(value=self.block_height)
+
+
+def signature_of(raw):
+    return VersionedTransaction.from_bytes(raw).signatures[0]
+
+
+def send_transfer(wallet):
+    instruction = transfer(
+        TransferParams(from_pubkey=wallet.keypair.pubkey(), to_pubkey=Pubkey.new_unique(), lamports=1)
+    )
+    return wallet.send_transaction(
+        {"instructions": [instruction], "address_lookup_table_addresses": None, "accounts_to_sign": None}
+    )
+
+
+@pytest.fixture(autouse=True)
+def fast_timing(monkeypatch):
+    monkeypatch.setattr(wallet_module, "SEND_RETRY_BASE_DELAY", 0)
+    monkeypatch.setattr(wallet_module, "RESEND_INTERVAL", 0.01)
+    monkeypatch.setattr(wallet_module, "CONFIRM_POLL_INTERVAL", 0.001)
+
+
+def test_retries_with_a_fresh_blockhash_when_blockhash_not_found():
+    client = FakeClient(
+        send_errors=[RPCException("Transaction simulation failed: Blockhash not found")], land_on_send=2
+    )
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    result = send_transfer(wallet)
+
+    first, second = (VersionedTransaction.from_bytes(raw) for raw in client.sent[:2])
+    assert first.message.recent_blockhash != second.message.recent_blockhash
+    assert result == {"hash": str(second.signatures[0])}
+    wallet.close()
+
+
+def test_other_simulation_failures_are_raised_without_retrying():
+    client = FakeClient(send_errors=[RPCException("Transaction simulation failed: custom program error: 0x1")])
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    with pytest.raises(RPCException):
+        send_transfer(wallet)
+    assert len(client.sent) == 1
+    wallet.close()
+
+
+def test_rebroadcasts_the_same_bytes_until_the_transaction_lands():
+    client = FakeClient(land_on_send=3)
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    result = send_transfer(wallet)
+
+    assert len(client.sent) == 3
+    assert len(set(client.sent)) == 1
+    assert result == {"hash": str(signature_of(client.sent[0]))}
+    wallet.close()
+
+
+def test_raises_when_the_blockhash_expires_before_landing():
+    client = FakeClient(land_on_send=None, last_valid_block_height=100, block_step=20)
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    with pytest.raises(Exception, match="expired before it was confirmed"):
+        send_transfer(wallet)
+    # Rebroadcasts stop once the blockhash is no longer valid
+    assert len(client.sent) == 3
+    wallet.close()
+
+
+def test_already_processed_retry_counts_as_sent():
+    # The first send lands but its response is lost; the retry is then rejected as a duplicate
+    client = FakeClient(
+        send_errors=[
+            Exception("timed out"),
+            RPCException("Transaction simulation failed: This transaction has already been processed"),
+        ],
+    )
+    wallet = SolanaKeypairWalletClient(client, Keypair())
+
+    result = send_transfer(wallet)
+
+    assert len(client.sent) == 2
+    assert client.sent[0] == client.sent[1]
+    assert result == {"hash": str(signature_of(client.sent[0]))}
+    wallet.close()
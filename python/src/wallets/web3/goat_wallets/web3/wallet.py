@@ -1,7 +1,11 @@
-from typing import Dict, Optional
+import re
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 from eth_typing import ChecksumAddress, HexStr
 from goat.classes.wallet_client_base import Balance, Signature
 from web3 import Web3
+from web3.contract import Contract
 from web3.types import Wei, TxParams
 from eth_utils.address import to_checksum_address
 from eth_account.messages import encode_defunct, encode_typed_data
@@ -21,8 +25,24 @@ class Web3Options:
     def __init__(
         self,
         paymaster: Optional[PaymasterOptions] = None,
+        ens_ttl_seconds: float = 600,
     ):
         self.paymaster = paymaster
+        self.ens_ttl_seconds = ens_ttl_seconds  # How long ENS resolutions are cached, 0 disables
+
+
+# Upper bound on cached contract instances per wallet client
+CONTRACT_CACHE_SIZE = 256
+
+WEI_PER_ETHER = 10**18
+
+_HEX_ADDRESS_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
+
+
+@lru_cache(maxsize=1024)
+def _to_checksum_address(address: str) -> ChecksumAddress:
+    """Memoized EIP-55 checksum; each call otherwise hashes the address with Keccak-256."""
+    return to_checksum_address(address)
 
 
 class Web3EVMWalletClient(EVMWalletClient):
@@ -35,6 +55,12 @@ class Web3EVMWalletClient(EVMWalletClient):
         self._default_paymaster_input = (
             options.paymaster["input"] if options and options.paymaster else None
         )
+        # (checksum address, id(abi)) -> (abi, contract). The abi is kept alongside the
+        # contract so its id cannot be recycled while the entry is alive.
+        self._contracts: Dict[Tuple[str, int], Tuple[List[Dict[str, Any]], Contract]] = {}
+        # lowercase ENS name -> (resolved at, checksum address)
+        self._ens_ttl_seconds = options.ens_ttl_seconds if options else 600
+        self._ens_cache: Dict[str, Tuple[float, ChecksumAddress]] = {}
 
     def get_address(self) -> str:
         if not self._web3.eth.default_account:
@@ -47,19 +73,53 @@ class Web3EVMWalletClient(EVMWalletClient):
 
     def resolve_address(self, address: str) -> ChecksumAddress:
         """Resolve an address to its canonical form."""
+        # Fast path for 0x-prefixed hex: all-lower/all-upper input carries no checksum to
+        # validate, and mixed case is valid only if it already equals its checksummed form
+        if _HEX_ADDRESS_RE.match(address):
+            checksummed = _to_checksum_address(address)
+            body = address[2:]
+            if address == checksummed or body == body.lower() or body == body.upper():
+                return checksummed
         # Check if it's already a valid address
-        if Web3.is_address(address):
+        elif Web3.is_address(address):
             return to_checksum_address(address)
 
+        # ENS records change rarely, so reuse recent resolutions
+        name = address.lower()
+        cached = self._ens_cache.get(name)
+        if cached is not None and monotonic() - cached[0] <= self._ens_ttl_seconds:
+            return cached[1]
+
         # Try ENS resolution if it's a domain
         try:
             resolved = self._web3.ens.address(address)  # type: ignore
             if not resolved:
                 raise ValueError("ENS name could not be resolved")
-            return to_checksum_address(resolved)
+            checksummed = to_checksum_address(resolved)
         except Exception as e:
             raise ValueError(f"Failed to resolve ENS name: {str(e)}")
 
+        if self._ens_ttl_seconds > 0:
+            self._ens_cache[name] = (monotonic(), checksummed)
+        return checksummed
+
+    def _get_contract(self, address: ChecksumAddress, abi: List[Dict[str, Any]]) -> Contract:
+        """Get a contract instance, reusing one already built for this address and ABI.
+
+        Building a contract parses the whole ABI, which is wasted work when the same
+        token contract is called repeatedly (e.g. approvals and balance reads).
+        """
+        key = (address, id(abi))
+        cached = self._contracts.get(key)
+        if cached is not None and cached[0] is abi:
+            return cached[1]
+
+        contract = self._web3.eth.contract(address=address, abi=abi)  # type: ignore
+        if len(self._contracts) >= CONTRACT_CACHE_SIZE:
+            del self._contracts[next(iter(self._contracts))]
+        self._contracts[key] = (abi, contract)
+        return contract
+
     def sign_message(self, message: str) -> Signature:
         """Sign a message with the current account."""
         if not self._web3.eth.default_account:
@@ -101,7 +161,7 @@ class Web3EVMWalletClient(EVMWalletClient):
         if not transaction.get("abi"):
             tx_params: TxParams = {
                 "from": self._web3.eth.default_account,
-                "to": to_checksum_address(to_address),
+                "to": to_address,
                 "chainId": self._web3.eth.chain_id,
                 "value": Wei(transaction.get("value", 0)),
                 "data": transaction.get("data", HexStr("")),
@@ -118,9 +178,7 @@ class Web3EVMWalletClient(EVMWalletClient):
         if not function_name:
             raise ValueError("Function name is required for contract calls")
 
-        contract = self._web3.eth.contract(
-            address=to_checksum_address(to_address), abi=transaction["abi"]  # type: ignore
-        )
+        contract = self._get_contract(to_address, transaction["abi"])  # type: ignore
 
         # Build the transaction
         contract_function = getattr(contract.functions, function_name)
@@ -158,9 +216,7 @@ class Web3EVMWalletClient(EVMWalletClient):
 
     def read(self, request: EVMReadRequest) -> EVMReadResult:
         """Read data from a smart contract."""
-        contract = self._web3.eth.contract(
-            address=self.resolve_address(request["address"]), abi=request["abi"]
-        )
+        contract = self._get_contract(self.resolve_address(request["address"]), request["abi"])
 
         function = getattr(contract.functions, request["functionName"])
         args = request.get("args", [])
@@ -173,16 +229,17 @@ class Web3EVMWalletClient(EVMWalletClient):
         resolved_address = self.resolve_address(address)
         balance_wei = self._web3.eth.get_balance(resolved_address)
 
-        chain_id = self._web3.eth.chain_id
         # Note: You might want to implement a chain registry to get proper currency details
         decimals = 18  # ETH decimals
         symbol = "ETH"
         name = "Ether"
 
-        formatted_balance = Web3.from_wei(balance_wei, "ether")
+        # Exact integer formatting instead of building a Decimal through from_wei
+        whole, fraction = divmod(balance_wei, WEI_PER_ETHER)
+        formatted_balance = f"{whole}.{fraction:018d}".rstrip("0").rstrip(".")
 
         return {
-            "value": str(formatted_balance),
+            "value": formatted_balance,
             "decimals": decimals,
             "symbol": symbol,
             "name": name,